@@ -1,5 +1,4 @@
 import os
-import json
 
 # General Configuration
 VERSION = "1.0.0" # Added application versioning
@@ -72,57 +71,58 @@ Categories:
 Respond with: {"action": "action_name", "content": "query_content"}
 """
 
-# Action Plan Examples
-ACTION_PLAN_EXAMPLES = [
-    {"role": "user", "content": "Explain a programming concept."},
-    {"role": "assistant", "content": json.dumps({"action": "knowledge_query", "content": "Explain a programming concept."})},
-    {"role": "user", "content": "Summarize this PDF."},
-    {"role": "assistant", "content": json.dumps({"action": "knowledge_query", "content": "Summarize this PDF."})},
-    {"role": "user", "content": "Give me a synopsis of Neuromancer."},
-    {"role": "assistant", "content": json.dumps({"action": "knowledge_query", "content": "synopsis of Neuromancer"})},
-    {"role": "user", "content": "What is a monad in Haskell?"},
-    {"role": "assistant", "content": json.dumps({"action": "knowledge_query", "content": "What is a monad in Haskell?"})},
-    {"role": "user", "content": "cd to Downloads"},
-    {"role": "assistant", "content": json.dumps({"action": "command", "content": "cd ~/Downloads"})},
-    {"role": "user", "content": "List everything in current directory."},
-    {"role": "assistant", "content": json.dumps({"action": "command", "content": "ls -a"})},
-    {"role": "user", "content": "Show me disk usage."},
-    {"role": "assistant", "content": json.dumps({"action": "command", "content": "df -h"})},
-    {"role": "user", "content": "cat /etc/hosts"},
-    {"role": "assistant", "content": json.dumps({"action": "command", "content": "cat /etc/hosts"})},
-    {"role": "user", "content": "ls my home dir"},
-    {"role": "assistant", "content": json.dumps({"action": "command", "content": "ls $HOME"})},
-    {"role": "user", "content": "list contents of my home directory"},
-    {"role": "assistant", "content": json.dumps({"action": "command", "content": "ls -a $HOME"})},
-    {"role": "user", "content": "What preferences have I saved?"},
-    {"role": "assistant", "content": json.dumps({"action": "retrieve_data", "content": "show preferences"})},
-    {"role": "user", "content": "What have I asked you before?"},
-    {"role": "assistant", "content": json.dumps({"action": "retrieve_data", "content": "interaction history"})},
-    {"role": "user", "content": "Remember that I prefer dark mode."},
-    {"role": "assistant", "content": json.dumps({"action": "store_data", "content": "I prefer dark mode"})},
-    {"role": "user", "content": "Store this fact: I use zsh."},
-    {"role": "assistant", "content": json.dumps({"action": "store_data", "content": "I use zsh"})},
-    {"role": "user", "content": "How's the system running?"},
-    {"role": "assistant", "content": json.dumps({"action": "system_status", "content": "system running status"})},
-    {"role": "user", "content": "kaia status"},
-    {"role": "assistant", "content": json.dumps({"action": "system_status", "content": "kaia status"})},
-    {"role": "user", "content": "Who are you?"},
-    {"role": "assistant", "content": json.dumps({"action": "get_persona_content", "content": "Who are you?"})},
-    {"role": "user", "content": "What can you do?"},
-    {"role": "assistant", "content": json.dumps({"action": "get_persona_content", "content": "What can you do?"})},
-    {"role": "user", "content": "Hey there."},
-    {"role": "assistant", "content": json.dumps({"action": "chat", "content": "Hey there."})},
-    {"role": "user", "content": "How’s your day?"},
-    {"role": "assistant", "content": json.dumps({"action": "chat", "content": "How’s your day?"})},
-    {"role": "user", "content": "run mp4-to-gif.sh"},
-    {"role": "assistant", "content": json.dumps({"action": "run_script", "content": "mp4-to-gif.sh"})},
-    {"role": "user", "content": "execute cleanup.py"},
-    {"role": "assistant", "content": json.dumps({"action": "run_script", "content": "cleanup.py"})},
-    {"role": "user", "content": "convert video to gif"},
-    {"role": "assistant", "content": json.dumps({"action": "convert_video_to_gif", "content": "video to gif"})},
-    {"role": "user", "content": "make a gif from this mp4"},
-    {"role": "assistant", "content": json.dumps({"action": "convert_video_to_gif", "content": "mp4 to gif"})},
-]
+# Action Plan Examples (built on first access via __getattr__ below)
+def _build_action_plan_examples():
+    return [
+        {"role": "user", "content": "Explain a programming concept."},
+        {"role": "assistant", "content": '{"action": "knowledge_query", "content": "Explain a programming concept."}'},
+        {"role": "user", "content": "Summarize this PDF."},
+        {"role": "assistant", "content": '{"action": "knowledge_query", "content": "Summarize this PDF."}'},
+        {"role": "user", "content": "Give me a synopsis of Neuromancer."},
+        {"role": "assistant", "content": '{"action": "knowledge_query", "content": "synopsis of Neuromancer"}'},
+        {"role": "user", "content": "What is a monad in Haskell?"},
+        {"role": "assistant", "content": '{"action": "knowledge_query", "content": "What is a monad in Haskell?"}'},
+        {"role": "user", "content": "cd to Downloads"},
+        {"role": "assistant", "content": '{"action": "command", "content": "cd ~/Downloads"}'},
+        {"role": "user", "content": "List everything in current directory."},
+        {"role": "assistant", "content": '{"action": "command", "content": "ls -a"}'},
+        {"role": "user", "content": "Show me disk usage."},
+        {"role": "assistant", "content": '{"action": "command", "content": "df -h"}'},
+        {"role": "user", "content": "cat /etc/hosts"},
+        {"role": "assistant", "content": '{"action": "command", "content": "cat /etc/hosts"}'},
+        {"role": "user", "content": "ls my home dir"},
+        {"role": "assistant", "content": '{"action": "command", "content": "ls $HOME"}'},
+        {"role": "user", "content": "list contents of my home directory"},
+        {"role": "assistant", "content": '{"action": "command", "content": "ls -a $HOME"}'},
+        {"role": "user", "content": "What preferences have I saved?"},
+        {"role": "assistant", "content": '{"action": "retrieve_data", "content": "show preferences"}'},
+        {"role": "user", "content": "What have I asked you before?"},
+        {"role": "assistant", "content": '{"action": "retrieve_data", "content": "interaction history"}'},
+        {"role": "user", "content": "Remember that I prefer dark mode."},
+        {"role": "assistant", "content": '{"action": "store_data", "content": "I prefer dark mode"}'},
+        {"role": "user", "content": "Store this fact: I use zsh."},
+        {"role": "assistant", "content": '{"action": "store_data", "content": "I use zsh"}'},
+        {"role": "user", "content": "How's the system running?"},
+        {"role": "assistant", "content": '{"action": "system_status", "content": "system running status"}'},
+        {"role": "user", "content": "kaia status"},
+        {"role": "assistant", "content": '{"action": "system_status", "content": "kaia status"}'},
+        {"role": "user", "content": "Who are you?"},
+        {"role": "assistant", "content": '{"action": "get_persona_content", "content": "Who are you?"}'},
+        {"role": "user", "content": "What can you do?"},
+        {"role": "assistant", "content": '{"action": "get_persona_content", "content": "What can you do?"}'},
+        {"role": "user", "content": "Hey there."},
+        {"role": "assistant", "content": '{"action": "chat", "content": "Hey there."}'},
+        {"role": "user", "content": "How’s your day?"},
+        {"role": "assistant", "content": '{"action": "chat", "content": "How\\u2019s your day?"}'},
+        {"role": "user", "content": "run mp4-to-gif.sh"},
+        {"role": "assistant", "content": '{"action": "run_script", "content": "mp4-to-gif.sh"}'},
+        {"role": "user", "content": "execute cleanup.py"},
+        {"role": "assistant", "content": '{"action": "run_script", "content": "cleanup.py"}'},
+        {"role": "user", "content": "convert video to gif"},
+        {"role": "assistant", "content": '{"action": "convert_video_to_gif", "content": "video to gif"}'},
+        {"role": "user", "content": "make a gif from this mp4"},
+        {"role": "assistant", "content": '{"action": "convert_video_to_gif", "content": "mp4 to gif"}'},
+    ]
 
 
 # Command Generation System Prompt
@@ -221,12 +221,12 @@ Assistant: find $HOME -type f -name "*.py"
 """
 
 # Whitelisted Safe Commands
-SAFE_COMMAND_ALLOWLIST = [
+SAFE_COMMAND_ALLOWLIST = frozenset({
     "ls", "cd", "pwd", "echo", "cat", "date", "df", "ps", "find", "grep",
     "pacman", "systemctl", "ip", "nmcli", "plasmashell", "kquitapp5",
     "kstart5", "systemsettings5", "mount", "umount", "lsusb", "lscpu",
     "free", "lsblk", "journalctl", "reboot", "poweroff"
-]
+})
 
 # Disk Mounts for System Status
 DISK_MOUNTS = [
@@ -252,3 +252,12 @@ SCRIPT_ALLOWLIST = [
     "find-file.sh",
     "update-system.sh"
 ]
+
+
+# Lazily built module attributes
+def __getattr__(name):
+    if name == "ACTION_PLAN_EXAMPLES":
+        value = _build_action_plan_examples()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,20 @@
 import os
+import atexit
+import io
 import logging
+import queue
 import re
 import string
+import threading
 import time
 import contextlib
-from typing import List, Dict, Tuple, Any
+import functools
+from typing import List, Dict, Tuple, Any, Optional
 from sqlalchemy import (
     create_engine, Column, Integer, Text, DateTime,
-    MetaData, Table, func, ForeignKey, Index, select, UniqueConstraint
+    MetaData, Table, func, ForeignKey, Index, select, UniqueConstraint, bindparam,
+    literal, literal_column, null, union_all
 )
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
 from sqlalchemy import inspect as sqlalchemy_inspect
@@ -25,6 +30,13 @@ DB_PASS = os.getenv('KAIA_DB_PASS', '')
 DB_HOST = os.getenv('KAIA_DB_HOST', 'localhost')
 DB_NAME = os.getenv('KAIA_DB_NAME', 'kaiadb')
 
+DB_POOL_SIZE = int(os.getenv('KAIA_DB_POOL_SIZE', 10))
+DB_MAX_OVERFLOW = int(os.getenv('KAIA_DB_MAX_OVERFLOW', 20))
+DB_POOL_TIMEOUT = int(os.getenv('KAIA_DB_POOL_TIMEOUT', 30))
+DB_POOL_RECYCLE = int(os.getenv('KAIA_DB_POOL_RECYCLE', 1800))
+# Off by default: recycling covers server idle timeouts without a SELECT 1 per checkout
+DB_POOL_PRE_PING = os.getenv('KAIA_DB_POOL_PRE_PING', '').lower() in ('1', 'true', 'yes')
+
 DB_URL_OBJECT = URL.create(
     "postgresql",
     username=DB_USER,
@@ -36,7 +48,7 @@ DB_PATH = str(DB_URL_OBJECT)
 
 # Database Initialization
 engine = None
-Session = None
+autocommit_engine = None
 metadata = MetaData()
 
 # Table Definitions
@@ -77,67 +89,135 @@ interaction_history_table = Table(
 
 Index("idx_interaction_timestamp", interaction_history_table.c.timestamp)
 
+# Composite indexes for the per-user, newest-first retrieval queries. They were
+# added after the tables shipped, so initialize_db also creates them on
+# existing databases (create_all only indexes tables it creates).
+_USER_TIMELINE_INDEXES = [
+    Index("idx_interaction_user_timestamp", interaction_history_table.c.user_id, interaction_history_table.c.timestamp.desc()),
+    Index("idx_facts_user_created", facts_table.c.user_id, facts_table.c.created_at.desc()),
+]
+
 # Natural Language Processing Helpers
+_PUNCTUATION_TRANSLATOR = str.maketrans('', '', string.punctuation)
+
+_STOPWORDS = frozenset({"what", "do", "you", "me", "my", "the", "a", "an", "is", "are", "show", "list", "about", "tell"})
+
 def normalize_query(query: str) -> Tuple[str, set]:
-    translator = str.maketrans('', '', string.punctuation)
-    clean_query = query.lower().translate(translator).strip()
-    tokens = set(clean_query.split())
-    stopwords = {"what", "do", "you", "me", "my", "the", "a", "an", "is", "are", "show", "list", "about", "tell"}
-    keywords = tokens - stopwords
-    return clean_query, keywords
+    # Phrase search is substring-based and split() ignores edge whitespace, so no strip()
+    clean_query = query.lower().translate(_PUNCTUATION_TRANSLATOR)
+    return clean_query, set(clean_query.split()) - _STOPWORDS
+
+# (category, phrases, keywords), checked in order
+_CATEGORY_PATTERNS: Tuple[Tuple[str, Tuple[str, ...], frozenset], ...] = (
+    (
+        "about_me",
+        (
+            "about me", "know about me", "remember about me", "tell me about myself",
+            "what know", "what remember", "my information", "my profile", "my data", "what do you know", "list all memories"
+        ),
+        frozenset({"myself", "profile", "information", "summary", "overview", "data", "memories"})
+    ),
+    (
+        "preferences",
+        (
+            "my preferences", "user preferences", "show preferences", "list preferences",
+            "what preferences", "preferences know", "my settings", "user settings", "what options"
+        ),
+        frozenset({"preferences", "settings", "options", "theme", "mode", "editor", "favorite"})
+    ),
+    (
+        "facts",
+        (
+            "my facts", "remembered facts", "show facts", "list facts",
+            "what facts", "facts know", "my information", "stored facts", "what remember"
+        ),
+        frozenset({"facts", "information", "remembered", "stored", "knows", "data"})
+    ),
+    (
+        "history",
+        (
+            "interaction history", "chat history", "show history", "list history",
+            "previous conversations", "past interactions", "our conversations", "my conversations", "list interactions", "what is our interaction history", "what history is known"
+        ),
+        frozenset({"history", "interactions", "conversations", "past", "previous", "logs"})
+    ),
+)
+
+# One alternation per category, compiled once; category order still decides ties
+_CATEGORY_PHRASE_RES = tuple(
+    (category, re.compile("|".join(re.escape(phrase) for phrase in phrases)))
+    for category, phrases, _ in _CATEGORY_PATTERNS
+)
+# Every phrase at once; most queries match none, so one scan rules out all four
+_ANY_CATEGORY_PHRASE_RE = re.compile(
+    "|".join(re.escape(phrase) for _, phrases, _ in _CATEGORY_PATTERNS for phrase in phrases)
+)
+
+# Keyword -> position of the first category listing it (built in reverse so
+# earlier categories win), so the lowest rank among a query's keywords picks
+# the same category as scanning the patterns in order
+_KEYWORD_CATEGORY_RANK: Dict[str, int] = {
+    keyword: rank
+    for rank, (_, _, category_keywords) in reversed(list(enumerate(_CATEGORY_PATTERNS)))
+    for keyword in category_keywords
+}
 
 def match_query_category(clean_query: str, keywords: set) -> str:
-    category_patterns = [
-        ("about_me", {
-            "phrases": [
-                "about me", "know about me", "remember about me", "tell me about myself",
-                "what know", "what remember", "my information", "my profile", "my data", "what do you know", "list all memories"
-            ],
-            "keywords": {"myself", "profile", "information", "summary", "overview", "data", "memories"}
-        }),
-        ("preferences", {
-            "phrases": [
-                "my preferences", "user preferences", "show preferences", "list preferences",
-                "what preferences", "preferences know", "my settings", "user settings", "what options"
-            ],
-            "keywords": {"preferences", "settings", "options", "theme", "mode", "editor", "favorite"}
-        }),
-        ("facts", {
-            "phrases": [
-                "my facts", "remembered facts", "show facts", "list facts",
-                "what facts", "facts know", "my information", "stored facts", "what remember"
-            ],
-            "keywords": {"facts", "information", "remembered", "stored", "knows", "data"}
-        }),
-        ("history", {
-            "phrases": [
-                "interaction history", "chat history", "show history", "list history",
-                "previous conversations", "past interactions", "our conversations", "my conversations", "list interactions", "what is our interaction history", "what history is known"
-            ],
-            "keywords": {"history", "interactions", "conversations", "past", "previous", "logs"}
-        })
-    ]
-
-    for category, pattern in category_patterns:
-        if any(phrase in clean_query for phrase in pattern["phrases"]):
-            return category
-
-    for category, pattern in category_patterns:
-        if keywords & pattern["keywords"]:
-            return category
+    if _ANY_CATEGORY_PHRASE_RE.search(clean_query):
+        for category, phrase_re in _CATEGORY_PHRASE_RES:
+            if phrase_re.search(clean_query):
+                return category
+
+    ranks = [_KEYWORD_CATEGORY_RANK[keyword] for keyword in keywords if keyword in _KEYWORD_CATEGORY_RANK]
+    if ranks:
+        return _CATEGORY_PATTERNS[min(ranks)][0]
 
     return "unknown"
 
+# Stock questions ("show history", "what do you know about me") repeat often
+@functools.lru_cache(maxsize=256)
+def _classify(query: str) -> str:
+    return match_query_category(*normalize_query(query))
+
 # Database Operations
 def initialize_db() -> bool:
-    global engine, Session
+    global engine, autocommit_engine, _table_names_cache
     logging.info("Initializing PostgreSQL database")
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            engine = create_engine(DB_PATH, pool_size=10, max_overflow=20, connect_args={"sslmode": "prefer"})
-            Session = sessionmaker(bind=engine)
-            metadata.create_all(engine)
+            engine = create_engine(
+                DB_PATH,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+                pool_pre_ping=DB_POOL_PRE_PING,
+                pool_recycle=DB_POOL_RECYCLE,
+                # Reuse the most recently returned connection so spare ones can idle out
+                pool_use_lifo=True,
+                connect_args={"sslmode": "prefer"}
+            )
+            # Shares the pool; single-statement reads and writes skip BEGIN/COMMIT on it
+            autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+            # One catalog query each for tables and indexes; DDL only when something is missing
+            inspector = sqlalchemy_inspect(engine)
+            table_names = inspector.get_table_names()
+            if not set(metadata.tables) <= set(table_names):
+                metadata.create_all(engine)
+                table_names = None
+                inspector = sqlalchemy_inspect(engine)  # the old one caches reflection
+            existing_indexes = {
+                reflected['name']
+                for table_indexes in inspector.get_multi_indexes(
+                    filter_names=[index.table.name for index in _USER_TIMELINE_INDEXES]
+                ).values()
+                for reflected in table_indexes
+            }
+            for index in _USER_TIMELINE_INDEXES:
+                if index.name not in existing_indexes:
+                    index.create(engine)
+            _table_names_cache = table_names
+            _start_interaction_writer()
             logging.info(f"PostgreSQL database initialized successfully for {DB_PATH}")
             return True
         except OperationalError as e:
@@ -154,126 +234,259 @@ def initialize_db() -> bool:
     return False
 
 @contextlib.contextmanager
-def get_session():
-    if Session is None or engine is None:
+def begin_connection():
+    if engine is None:
         raise RuntimeError("Database not initialized. Call initialize_db() first.")
-    session = Session()
-    try:
-        yield session
-    finally:
-        session.close()
+    with engine.begin() as conn:
+        yield conn
+
+# Single-statement reads and writes; autocommit skips the BEGIN/COMMIT round trips
+@contextlib.contextmanager
+def autocommit_connection():
+    if autocommit_engine is None:
+        raise RuntimeError("Database not initialized. Call initialize_db() first.")
+    with autocommit_engine.connect() as conn:
+        yield conn
+
+# Users known to exist in this process; their writes skip the users upsert
+_ensured_users = set()
+
+def _with_ensure_user(stmt, user_id: str):
+    # Lets a write create its user row in the same statement (WITH ... INSERT)
+    if user_id in _ensured_users:
+        return stmt
+    return stmt.add_cte(
+        postgresql.insert(users_table).values(user_id=user_id).on_conflict_do_nothing(
+            index_elements=['user_id']
+        ).cte('ensure_user')
+    )
 
 def ensure_user(user_id: str):
-    with get_session() as session:
-        try:
+    if user_id in _ensured_users:
+        return
+    try:
+        with autocommit_connection() as conn:
             stmt = postgresql.insert(users_table).values(user_id=user_id)
             stmt = stmt.on_conflict_do_nothing(index_elements=['user_id'])
-            session.execute(stmt)
-            session.commit()
-        except SQLAlchemyError as e:
-            session.rollback()
-            logging.error(f"Error ensuring user '{user_id}': {e}")
+            conn.execute(stmt)
+        _ensured_users.add(user_id)
+    except SQLAlchemyError as e:
+        logging.error(f"Error ensuring user '{user_id}': {e}")
+
+_PREFERENCE_RE = re.compile(r"(?:i prefer|my preference is|my preferred (?:editor|theme|mode) is)\s*(.+)", re.I)
+_KEY_VALUE_RE = re.compile(r"(.+?)(?:\s+is\s+|=)\s*(.+)", re.I)
+# Every _PREFERENCE_RE match starts with one of these; most content is a plain fact
+_PREFERENCE_PREFIXES = ("i prefer", "my prefer")
+
+# (key, value) for preference statements, None for plain facts; key may be empty
+def _parse_preference(content: str) -> Optional[Tuple[str, str]]:
+    if not content[:9].lower().startswith(_PREFERENCE_PREFIXES):
+        return None
+    pref_match = _PREFERENCE_RE.match(content)
+    if not pref_match:
+        return None
+    preference_phrase = pref_match.group(1).strip()
+    key_value_match = _KEY_VALUE_RE.match(preference_phrase)
+    if key_value_match:
+        return key_value_match.group(1).strip(), key_value_match.group(2).strip()
+    return preference_phrase, "enabled"
 
 def handle_memory_storage(user_id: str, content: str) -> Tuple[bool, str]:
-    with get_session() as session:
-        try:
-            pref_match = re.match(r"(?:i prefer|my preference is|my preferred (?:editor|theme|mode) is)\s*(.+)", content, re.I)
-            if pref_match:
-                preference_phrase = pref_match.group(1).strip()
-                key = ""
-                value = ""
-                key_value_match = re.match(r"(.+?)(?:\s+is\s+|=)\s*(.+)", preference_phrase, re.I)
-                if key_value_match:
-                    key = key_value_match.group(1).strip()
-                    value = key_value_match.group(2).strip()
-                else:
-                    key = preference_phrase
-                    value = "enabled"
-
-                if not key:
-                    return False, "Please specify what preference you want me to remember (e.g., 'dark mode' or 'my theme is dark')."
-
-                stmt = postgresql.insert(user_preferences_table).values(
-                    user_id=user_id,
-                    preference_key=key,
-                    preference_value=value
-                )
-                on_conflict_stmt = stmt.on_conflict_do_update(
-                    index_elements=['user_id', 'preference_key'],
-                    set_=dict(preference_value=stmt.excluded.preference_value, last_updated=func.now())
-                )
-                session.execute(on_conflict_stmt)
-                session.commit()
-                logging.info(f"Preference '{key}: {value}' stored for user '{user_id}'.")
-                return True, f"Okay, I'll remember that your preference for '{key}' is '{value}'."
-
-            fact_text = content.strip()
-            if not fact_text:
-                return False, "Please provide content to remember."
-
-            session.execute(facts_table.insert().values(user_id=user_id, fact_text=fact_text))
-            session.commit()
-            logging.info(f"Fact '{fact_text}' stored for user '{user_id}'.")
-            return True, f"Got it. I'll remember that: {fact_text}."
-
-        except re.error as e:
-            session.rollback()
-            logging.error(f"Preference parsing regex error: {e}", exc_info=True)
-            return False, f"Preference parsing error: {e}"
-        except IntegrityError:
-            session.rollback()
-            return False, "There was a database error storing that. It might be a duplicate."
-        except Exception as e:
-            session.rollback()
-            logging.error(f"Error storing memory: {e}", exc_info=True)
-            return False, f"An unexpected error occurred while trying to remember that: {e}"
+    try:
+        preference = _parse_preference(content)
+        if preference is not None:
+            key, value = preference
+            if not key:
+                return False, "Please specify what preference you want me to remember (e.g., 'dark mode' or 'my theme is dark')."
+
+            # inline(): skip the implicit RETURNING preference_id nobody reads
+            stmt = postgresql.insert(user_preferences_table).inline().values(
+                user_id=user_id,
+                preference_key=key,
+                preference_value=value
+            )
+            on_conflict_stmt = stmt.on_conflict_do_update(
+                index_elements=['user_id', 'preference_key'],
+                set_=dict(preference_value=stmt.excluded.preference_value, last_updated=func.now())
+            )
+            with autocommit_connection() as conn:
+                conn.execute(_with_ensure_user(on_conflict_stmt, user_id))
+            _ensured_users.add(user_id)
+            invalidate_user_cache(user_id)
+            logging.info(f"Preference '{key}: {value}' stored for user '{user_id}'.")
+            return True, f"Okay, I'll remember that your preference for '{key}' is '{value}'."
+
+        fact_text = content.strip()
+        if not fact_text:
+            return False, "Please provide content to remember."
+
+        with autocommit_connection() as conn:
+            conn.execute(_with_ensure_user(facts_table.insert().inline().values(user_id=user_id, fact_text=fact_text), user_id))
+        _ensured_users.add(user_id)
+        invalidate_user_cache(user_id)
+        logging.info(f"Fact '{fact_text}' stored for user '{user_id}'.")
+        return True, f"Got it. I'll remember that: {fact_text}."
+
+    except re.error as e:
+        logging.error(f"Preference parsing regex error: {e}", exc_info=True)
+        return False, f"Preference parsing error: {e}"
+    except IntegrityError:
+        return False, "There was a database error storing that. It might be a duplicate."
+    except Exception as e:
+        logging.error(f"Error storing memory: {e}", exc_info=True)
+        return False, f"An unexpected error occurred while trying to remember that: {e}"
 
 def handle_data_retrieval(user_id: str, query: str) -> Dict[str, Any]:
-    with get_session() as session:
-        try:
-            clean_query, keywords = normalize_query(query)
-            category = match_query_category(clean_query, keywords)
+    try:
+        category = _classify(query)
+        if category == "unknown":
+            return {
+                'message': "I can retrieve your preferences, facts, or interaction history. Please be more specific.",
+                'data': [],
+                'response_type': "unhandled_retrieval_query"
+            }
 
+        with autocommit_connection() as conn:
             if category == "about_me":
-                return get_user_profile(session, user_id)
+                return get_user_profile(conn, user_id)
             elif category == "preferences":
-                return get_user_preferences(session, user_id)
+                return get_user_preferences(conn, user_id)
             elif category == "facts":
-                return get_user_facts(session, user_id)
-            elif category == "history":
-                return get_interaction_history(session, user_id)
+                return get_user_facts(conn, user_id)
             else:
-                return {
-                    'message': "I can retrieve your preferences, facts, or interaction history. Please be more specific.",
-                    'data': [],
-                    'response_type': "unhandled_retrieval_query"
-                }
-
-        except SQLAlchemyError as e:
-            logging.error(f"Database error during retrieval: {e}", exc_info=True)
-            return {
-                'message': "A database error occurred while retrieving your information.",
-                'data': [],
-                'response_type': "retrieval_error"
-            }
-        except Exception as e:
-            logging.error(f"Unexpected retrieval error: {e}", exc_info=True)
-            return {
-                'message': "An unexpected error occurred while processing your request.",
-                'data': [],
-                'response_type': "retrieval_error"
-            }
+                return get_interaction_history(conn, user_id)
+    except SQLAlchemyError as e:
+        logging.error(f"Database error during retrieval: {e}", exc_info=True)
+        return {
+            'message': "A database error occurred while retrieving your information.",
+            'data': [],
+            'response_type': "retrieval_error"
+        }
+    except Exception as e:
+        logging.error(f"Unexpected retrieval error: {e}", exc_info=True)
+        return {
+            'message': "An unexpected error occurred while processing your request.",
+            'data': [],
+            'response_type': "retrieval_error"
+        }
 
 # Modular Data Retrieval Functions
-def get_user_profile(session, user_id: str) -> Dict[str, Any]:
-    all_data = []
+FACTS_LIMIT = 100  # Most recent facts returned per retrieval
+HISTORY_LIMIT = 10  # Most recent interactions returned per retrieval
+HISTORY_TIMESTAMP_FORMAT = "YYYY-MM-DD HH24:MI:SS"  # PostgreSQL to_char pattern
+HISTORY_RESPONSE_PREVIEW_CHARS = 70
+RETRIEVAL_CACHE_TTL_SECONDS = 60
+
+_PREFERENCES_STMT = select(
+    user_preferences_table.c.preference_key,
+    user_preferences_table.c.preference_value
+).where(user_preferences_table.c.user_id == bindparam('uid'))
+
+# OFFSET still scans the skipped rows; for deep pages switch to a keyset
+# filter on created_at < :cursor, which idx_facts_user_created serves directly
+_FACTS_STMT = (
+    select(facts_table.c.fact_text)
+    .where(facts_table.c.user_id == bindparam('uid'))
+    .order_by(facts_table.c.created_at.desc())
+    .limit(bindparam('limit'))
+    .offset(bindparam('offset'))
+)
+
+# Formats and truncates server-side so full responses never leave the database
+_HISTORY_STMT = (
+    select(
+        func.to_char(interaction_history_table.c.timestamp, HISTORY_TIMESTAMP_FORMAT),
+        interaction_history_table.c.user_query,
+        func.left(interaction_history_table.c.kaia_response, HISTORY_RESPONSE_PREVIEW_CHARS),
+        func.length(interaction_history_table.c.kaia_response) > HISTORY_RESPONSE_PREVIEW_CHARS
+    )
+    .where(interaction_history_table.c.user_id == bindparam('uid'))
+    .order_by(interaction_history_table.c.timestamp.desc())
+    .limit(HISTORY_LIMIT)
+)
 
-    prefs = session.execute(
+# Preferences and a page of facts in one round trip, tagged by kind
+_PROFILE_STMT = union_all(
+    select(
+        literal('pref').label('kind'),
+        user_preferences_table.c.preference_key.label('a'),
+        user_preferences_table.c.preference_value.label('b'),
+        null().label('created_at')
+    ).where(user_preferences_table.c.user_id == bindparam('uid')),
+    select(
         select(
-            user_preferences_table.c.preference_key,
-            user_preferences_table.c.preference_value
-        ).filter_by(user_id=user_id)
-    ).fetchall()
+            literal('fact').label('kind'),
+            facts_table.c.fact_text.label('a'),
+            null().label('b'),
+            facts_table.c.created_at
+        )
+        .where(facts_table.c.user_id == bindparam('uid'))
+        .order_by(facts_table.c.created_at.desc())
+        .limit(bindparam('limit'))
+        .subquery()
+    )
+).order_by(literal_column('created_at').desc())
+
+# Per-user read caches: key -> (monotonic time loaded, rows); cleared on writes
+_preferences_cache: Dict[str, Tuple[float, Tuple[Tuple[str, str], ...]]] = {}
+_facts_cache: Dict[Tuple[str, int, int], Tuple[float, Tuple[str, ...]]] = {}
+
+def invalidate_user_cache(user_id: str):
+    _preferences_cache.pop(user_id, None)
+    for key in [key for key in _facts_cache if key[0] == user_id]:
+        _facts_cache.pop(key, None)
+
+def _fetch_preferences(conn, user_id: str) -> Tuple[Tuple[str, str], ...]:
+    now = time.monotonic()
+    cached = _preferences_cache.get(user_id)
+    if cached and now - cached[0] < RETRIEVAL_CACHE_TTL_SECONDS:
+        return cached[1]
+    prefs = tuple((key, value) for key, value in conn.execute(_PREFERENCES_STMT, {'uid': user_id}))
+    _preferences_cache[user_id] = (now, prefs)
+    return prefs
+
+def _fetch_facts(conn, user_id: str, facts_limit: int, facts_offset: int = 0) -> Tuple[str, ...]:
+    now = time.monotonic()
+    cache_key = (user_id, facts_limit, facts_offset)
+    cached = _facts_cache.get(cache_key)
+    if cached and now - cached[0] < RETRIEVAL_CACHE_TTL_SECONDS:
+        return cached[1]
+    facts = tuple(conn.execute(
+        _FACTS_STMT, {'uid': user_id, 'limit': facts_limit, 'offset': facts_offset}
+    ).scalars())
+    _facts_cache[cache_key] = (now, facts)
+    return facts
+
+def _fetch_profile(conn, user_id: str, facts_limit: int) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    now = time.monotonic()
+    cached_prefs = _preferences_cache.get(user_id)
+    cached_facts = _facts_cache.get((user_id, facts_limit, 0))
+    if not (cached_prefs and now - cached_prefs[0] < RETRIEVAL_CACHE_TTL_SECONDS):
+        cached_prefs = None
+    if not (cached_facts and now - cached_facts[0] < RETRIEVAL_CACHE_TTL_SECONDS):
+        cached_facts = None
+    if cached_prefs and cached_facts:
+        return cached_prefs[1], cached_facts[1]
+    if cached_prefs:
+        return cached_prefs[1], _fetch_facts(conn, user_id, facts_limit)
+    if cached_facts:
+        return _fetch_preferences(conn, user_id), cached_facts[1]
+
+    prefs, facts = [], []
+    for kind, a, b, _ in conn.execute(_PROFILE_STMT, {'uid': user_id, 'limit': facts_limit}):
+        if kind == 'pref':
+            prefs.append((a, b))
+        else:
+            facts.append(a)
+    prefs, facts = tuple(prefs), tuple(facts)
+    _preferences_cache[user_id] = (now, prefs)
+    _facts_cache[(user_id, facts_limit, 0)] = (now, facts)
+    return prefs, facts
+
+def get_user_profile(conn, user_id: str, facts_limit: int = FACTS_LIMIT) -> Dict[str, Any]:
+    all_data = []
+
+    prefs, facts = _fetch_profile(conn, user_id, facts_limit)
 
     if prefs:
         all_data.append("Your preferences:")
@@ -281,14 +494,9 @@ def get_user_profile(session, user_id: str) -> Dict[str, Any]:
     else:
         all_data.append("You haven't told me any preferences yet.")
 
-    facts = session.execute(
-        select(facts_table.c.fact_text)
-        .filter_by(user_id=user_id)
-    ).fetchall()
-
     if facts:
         all_data.append("\nFacts I remember:")
-        all_data.extend(f"• {fact[0]}" for fact in facts)
+        all_data.extend(f"• {fact}" for fact in facts)
     else:
         all_data.append("\nI haven't stored any facts for you yet.")
 
@@ -298,13 +506,8 @@ def get_user_profile(session, user_id: str) -> Dict[str, Any]:
         'response_type': "user_profile_retrieved"
     }
 
-def get_user_preferences(session, user_id: str) -> Dict[str, Any]:
-    prefs = session.execute(
-        select(
-            user_preferences_table.c.preference_key,
-            user_preferences_table.c.preference_value
-        ).filter_by(user_id=user_id)
-    ).fetchall()
+def get_user_preferences(conn, user_id: str) -> Dict[str, Any]:
+    prefs = _fetch_preferences(conn, user_id)
 
     if prefs:
         return {
@@ -318,16 +521,13 @@ def get_user_preferences(session, user_id: str) -> Dict[str, Any]:
         'response_type': "no_preferences"
     }
 
-def get_user_facts(session, user_id: str) -> Dict[str, Any]:
-    facts = session.execute(
-        select(facts_table.c.fact_text)
-        .filter_by(user_id=user_id)
-    ).fetchall()
+def get_user_facts(conn, user_id: str, facts_limit: int = FACTS_LIMIT, facts_offset: int = 0) -> Dict[str, Any]:
+    facts = _fetch_facts(conn, user_id, facts_limit, facts_offset)
 
     if facts:
         return {
             'message': "Facts I remember:",
-            'data': [fact[0] for fact in facts],
+            'data': list(facts),
             'response_type': "facts_retrieved"
         }
     return {
@@ -336,24 +536,15 @@ def get_user_facts(session, user_id: str) -> Dict[str, Any]:
         'response_type': "no_facts"
     }
 
-def get_interaction_history(session, user_id: str) -> Dict[str, Any]:
-    history = session.execute(
-        select(
-            interaction_history_table.c.timestamp,
-            interaction_history_table.c.user_query,
-            interaction_history_table.c.kaia_response
-        )
-        .filter_by(user_id=user_id)
-        .order_by(interaction_history_table.c.timestamp.desc())
-        .limit(10)
-    ).fetchall()
+def get_interaction_history(conn, user_id: str) -> Dict[str, Any]:
+    history = conn.execute(_HISTORY_STMT, {'uid': user_id}).fetchall()
 
     if history:
         formatted = []
-        for timestamp, query, response in history:
-            time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            truncated_response = (response[:70] + '...') if len(response) > 70 else response
-            formatted.append(f"[{time_str}] You: {query} | Kaia: {truncated_response}")
+        for time_str, query, response, truncated in history:
+            if truncated:
+                response += '...'
+            formatted.append(f"[{time_str or 'Unknown time'}] You: {query} | Kaia: {response}")
         return {
             'message': "Recent interactions:",
             'data': formatted,
@@ -365,31 +556,228 @@ def get_interaction_history(session, user_id: str) -> Dict[str, Any]:
         'response_type': "no_history"
     }
 
-def log_interaction(user_id: str, user_query: str, kaia_response: str, response_type: str):
-    with get_session() as session:
+# Bulk Writes
+# Batches at or above this size are loaded with COPY instead of a multi-row INSERT
+BULK_COPY_THRESHOLD = 1024
+
+def _ensure_users(conn, rows: List[Dict[str, Any]]) -> List[str]:
+    user_ids = sorted({row['user_id'] for row in rows} - _ensured_users)
+    if user_ids:
+        conn.execute(
+            postgresql.insert(users_table)
+            .values([{'user_id': user_id} for user_id in user_ids])
+            .on_conflict_do_nothing(index_elements=['user_id'])
+        )
+    return user_ids
+
+def _copy_field(value: Any) -> str:
+    # PostgreSQL COPY text format: \N is NULL; backslash, tab and newlines are escaped
+    if value is None:
+        return r"\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+def _bulk_insert(table: Table, rows: List[Dict[str, Any]], durable: bool = True) -> int:
+    if not rows:
+        return 0
+    with begin_connection() as conn:
+        if not durable:
+            # Commit without waiting for the WAL flush; a crash can lose only this batch
+            conn.exec_driver_sql("SET LOCAL synchronous_commit = off")
+        new_user_ids = _ensure_users(conn, rows)
+        if len(rows) < BULK_COPY_THRESHOLD:
+            conn.execute(table.insert(), rows)
+        else:
+            columns = list(rows[0])
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write("\t".join(_copy_field(row[column]) for column in columns))
+                buffer.write("\n")
+            buffer.seek(0)
+            # Same DBAPI connection, so the COPY commits with the users upsert above
+            cursor = conn.connection.cursor()
+            try:
+                cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN", buffer)
+            finally:
+                cursor.close()
+    _ensured_users.update(new_user_ids)
+    return len(rows)
+
+# Rows need 'user_id' and 'fact_text'; 'created_at' defaults to now
+def bulk_add_facts(rows: List[Dict[str, Any]]) -> int:
+    now = datetime.now().astimezone()
+    count = _bulk_insert(facts_table, [
+        {'user_id': row['user_id'], 'fact_text': row['fact_text'], 'created_at': row.get('created_at') or now}
+        for row in rows
+    ])
+    for user_id in {row['user_id'] for row in rows}:
+        invalidate_user_cache(user_id)
+    return count
+
+PREFERENCE_UPSERT_PAGE_SIZE = 500
+
+# One multi-row INSERT ... ON CONFLICT per page; the user row must already exist
+def _upsert_preferences(conn, user_id: str, items: List[Tuple[str, str]]):
+    for start in range(0, len(items), PREFERENCE_UPSERT_PAGE_SIZE):
+        stmt = postgresql.insert(user_preferences_table).values([
+            {'user_id': user_id, 'preference_key': key, 'preference_value': value}
+            for key, value in items[start:start + PREFERENCE_UPSERT_PAGE_SIZE]
+        ])
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=['user_id', 'preference_key'],
+            set_=dict(preference_value=stmt.excluded.preference_value, last_updated=func.now())
+        ))
+
+def bulk_set_preferences(user_id: str, preferences: Dict[str, str]) -> int:
+    items = list(preferences.items())
+    if not items:
+        return 0
+    with begin_connection() as conn:
+        new_user_ids = _ensure_users(conn, [{'user_id': user_id}])
+        _upsert_preferences(conn, user_id, items)
+    _ensured_users.update(new_user_ids)
+    invalidate_user_cache(user_id)
+    return len(items)
+
+# Stores several memories in one transaction; preferences and facts are parsed
+# exactly as handle_memory_storage does, then written as one statement each
+def handle_memory_storage_bulk(user_id: str, contents: List[str]) -> Tuple[bool, str]:
+    preferences: Dict[str, str] = {}
+    fact_texts = []
+    for content in contents:
+        preference = _parse_preference(content)
+        if preference is None:
+            fact_text = content.strip()
+            if fact_text:
+                fact_texts.append(fact_text)
+        elif preference[0]:
+            preferences[preference[0]] = preference[1]
+
+    if not preferences and not fact_texts:
+        return False, "Please provide content to remember."
+
+    try:
+        with begin_connection() as conn:
+            new_user_ids = _ensure_users(conn, [{'user_id': user_id}])
+            if preferences:
+                _upsert_preferences(conn, user_id, list(preferences.items()))
+            if fact_texts:
+                conn.execute(facts_table.insert(), [
+                    {'user_id': user_id, 'fact_text': fact_text} for fact_text in fact_texts
+                ])
+        _ensured_users.update(new_user_ids)
+        invalidate_user_cache(user_id)
+        logging.info(f"Stored {len(preferences)} preference(s) and {len(fact_texts)} fact(s) for user '{user_id}'.")
+        return True, f"Got it. I'll remember {len(preferences)} preference(s) and {len(fact_texts)} fact(s)."
+    except IntegrityError:
+        return False, "There was a database error storing that. It might be a duplicate."
+    except Exception as e:
+        logging.error(f"Error storing memories: {e}", exc_info=True)
+        return False, f"An unexpected error occurred while trying to remember that: {e}"
+
+# Writes directly, bypassing the background interaction queue
+def bulk_log_interactions(rows: List[Dict[str, Any]]) -> int:
+    now = datetime.now().astimezone()
+    return _bulk_insert(interaction_history_table, [
+        {
+            'user_id': row['user_id'],
+            'timestamp': row.get('timestamp') or now,
+            'user_query': row['user_query'],
+            'kaia_response': row['kaia_response'],
+            'response_type': row.get('response_type')
+        }
+        for row in rows
+    ])
+
+# Interaction Logging
+# Interactions are queued and written in batches by a background thread so the
+# chat loop does not wait on an INSERT + COMMIT every turn.
+INTERACTION_BATCH_SIZE = 50
+INTERACTION_FLUSH_INTERVAL_SECONDS = 0.25
+INTERACTION_QUEUE_MAXSIZE = 10000  # Bounds memory if the database stalls
+_interaction_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=INTERACTION_QUEUE_MAXSIZE)
+_interaction_writer: Optional[threading.Thread] = None
+
+def _write_interactions(rows: List[Dict[str, Any]]):
+    try:
+        _bulk_insert(interaction_history_table, rows, durable=False)
+        logging.info(f"Logged {len(rows)} interaction(s).")
+    except Exception as e:
+        logging.error(f"Error logging {len(rows)} interaction(s): {e}", exc_info=True)
+
+def _interaction_writer_loop():
+    while True:
+        rows = [_interaction_queue.get()]
+        deadline = time.monotonic() + INTERACTION_FLUSH_INTERVAL_SECONDS
+        while len(rows) < INTERACTION_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(_interaction_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _write_interactions(rows)
+        for _ in rows:
+            _interaction_queue.task_done()
+
+def _start_interaction_writer():
+    global _interaction_writer
+    if _interaction_writer is not None and _interaction_writer.is_alive():
+        return
+    _interaction_writer = threading.Thread(target=_interaction_writer_loop, name="kaia-interaction-writer", daemon=True)
+    _interaction_writer.start()
+
+def flush_interactions():
+    rows = []
+    while True:
         try:
-            session.execute(interaction_history_table.insert().values(
-                user_id=user_id,
-                user_query=user_query,
-                kaia_response=kaia_response,
-                response_type=response_type
-            ))
-            session.commit()
-            logging.info(f"Interaction logged for user '{user_id}'.")
-        except Exception as e:
-            session.rollback()
-            logging.error(f"Error logging interaction for user '{user_id}': {e}", exc_info=True)
+            rows.append(_interaction_queue.get_nowait())
+        except queue.Empty:
+            break
+    if rows:
+        _write_interactions(rows)
+        for _ in rows:
+            _interaction_queue.task_done()
+    # Wait for any batch the writer thread has already taken off the queue
+    _interaction_queue.join()
+
+atexit.register(flush_interactions)
+
+def log_interaction(user_id: str, user_query: str, kaia_response: str, response_type: str):
+    row = {
+        'user_id': user_id,
+        'timestamp': datetime.now().astimezone(),
+        'user_query': user_query,
+        'kaia_response': kaia_response,
+        'response_type': response_type
+    }
+    if _interaction_writer is None:
+        _write_interactions([row])
+        return
+    try:
+        _interaction_queue.put_nowait(row)
+    except queue.Full:
+        # Writer is behind; write this one inline rather than block the turn indefinitely
+        _write_interactions([row])
 
 # Database Status Check
+# Tables only change in initialize_db(), which clears this
+_table_names_cache: Optional[List[str]] = None
+
 def get_database_status() -> Dict:
+    global _table_names_cache
     if not engine:
         return {'connected': False, 'error': 'Engine not initialized', 'tables': []}
 
     try:
-        inspector = sqlalchemy_inspect(engine)
+        if _table_names_cache is None:
+            _table_names_cache = sqlalchemy_inspect(engine).get_table_names()
+        else:
+            with engine.connect() as conn:
+                conn.exec_driver_sql("SELECT 1")
         return {
             'connected': True,
-            'tables': inspector.get_table_names()
+            'tables': _table_names_cache
         }
     except Exception as e:
         logging.error(f"Error getting database status: {e}", exc_info=True)
@@ -400,8 +788,14 @@ def get_database_status() -> Dict:
         }
 
 # User Identification
+# Constant for the process lifetime, so looked up once
+_current_user: Optional[str] = None
+
 def get_current_user() -> str:
-    try:
-        return os.getlogin()
-    except (OSError, AttributeError):
-        return "default_user"
+    global _current_user
+    if _current_user is None:
+        try:
+            _current_user = os.getlogin()
+        except (OSError, AttributeError):
+            _current_user = "default_user"
+    return _current_user
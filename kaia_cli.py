@@ -5,23 +5,113 @@ import platform
 import psutil
 import re
 import shlex
+import socket
 import subprocess
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import config
 import utils
 
+# Optional: read NVIDIA GPU stats in-process via NVML instead of spawning nvidia-smi
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
 logger = logging.getLogger(__name__)
 
+# Command Cleanup Patterns
+_CODE_BLOCK_RE = re.compile(r'```(?:bash|sh)?\n(.*?)```', re.DOTALL)
+_ROLE_PREFIX_RE = re.compile(r'(User:|Assistant:)\s*', re.IGNORECASE)
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+_COMMAND_RE = re.compile(r'^\s*([a-zA-Z0-9_./-]+(?:\s+[^&;|`\n]*)*)')
+_CONVERSATIONAL_PHRASES = [
+    r'That covers.*',
+    r'Here is the command.*',
+    r'The command is.*',
+    r'Here\'s the command.*',
+    r'This is the command.*',
+    r'I can only provide raw shell commands.*',
+    r'Feel free to ask.*',
+    r'Just remember that I can only provide raw commands.*',
+    r'Keep in mind that I can only provide raw shell commands.*',
+    r'If you need help with more specific tasks.*',
+    r'Please find the command below.*',
+    r'The requested command is.*',
+    r'Here you go.*',
+    r'Here\'s what you asked for.*',
+    r'As per your request.*',
+    r'This should do the trick.*'
+]
+_CONVERSATIONAL_PHRASE_RES = [re.compile(p, re.IGNORECASE | re.DOTALL) for p in _CONVERSATIONAL_PHRASES]
+# Single-pass check for any phrase; phrases overlap, so truncation itself stays in list order
+_ANY_CONVERSATIONAL_RE = re.compile('|'.join(f'(?:{p})' for p in _CONVERSATIONAL_PHRASES), re.IGNORECASE | re.DOTALL)
+# Fenced blocks are removed after the truncating phrases, as a separate pass
+_FENCED_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+
+def _strip_conversational(text: str) -> str:
+    if _ANY_CONVERSATIONAL_RE.search(text):
+        for phrase_re in _CONVERSATIONAL_PHRASE_RES:
+            text = phrase_re.sub('', text).strip()
+    return _FENCED_BLOCK_RE.sub('', text).strip()
+
+# First /proc/cpuinfo block fields
+_CPU_MODEL_RE = re.compile(r'^model name\s*:\s*(.+)$', re.MULTILINE)
+_CPU_MHZ_RE = re.compile(r'^cpu MHz\s*:\s*([\d.]+)', re.MULTILINE)
+CPUINFO_READ_BYTES = 4096  # Enough for the first processor block
+# Single characters; a lone & or | is as unsafe as && or ||
+_UNSAFE_CHARS = frozenset('&;|`\n')
+
+_GIB = 1 << 30
+
+# Bytes to GiB rounded to 2 decimals in integer math (half-up, so 15.999 GiB still shows 16.0)
+def _gib(num_bytes: int) -> float:
+    return ((num_bytes * 100 + _GIB // 2) // _GIB) / 100
+
+# Shared across calls; runs the status collectors that mostly wait on I/O
+_STATUS_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="kaia-status")
+
 class KaiaCLI:
+    STATUS_CACHE_TTL_SECONDS = 3  # Repeated /status calls within this window reuse the last snapshot
+
     def __init__(self):
-        pass
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Seed psutil's counters so later non-blocking reads measure usage since the previous call
+        psutil.cpu_percent(interval=None)
+        # Fixed for the life of the process
+        self._boot_time = psutil.boot_time()
+        self._physical_cores = psutil.cpu_count(logical=False)
+        self._logical_cores = psutil.cpu_count(logical=True)
+        self._nvml_handles = self._init_nvml()
+        self._cpu_name: Optional[str] = None  # Filled on first read of /proc/cpuinfo
+
+    # NVML Initialization
+    def _init_nvml(self) -> Optional[List[Any]]:
+        if pynvml is None:
+            return None
+        try:
+            pynvml.nvmlInit()
+            return [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+        except pynvml.NVMLError as e:
+            logger.info(f"NVML unavailable, skipping NVIDIA GPU info retrieval: {e}")
+            return []
 
     # System Status Retrieval
-    def get_system_status(self) -> Dict[str, Any]:
+    def get_system_status(self, refresh: bool = False) -> Dict[str, Any]:
+        now = time.monotonic()
+        if not refresh and self._status_cache and now - self._status_cache[0] < self.STATUS_CACHE_TTL_SECONDS:
+            # Shallow copy: callers attach their own keys (e.g. db_status)
+            return dict(self._status_cache[1])
+
+        # Subprocess, socket and mount probes overlap instead of running back to back
+        disk_future = _STATUS_EXECUTOR.submit(self._get_all_disk_usage)
+        gpu_future = _STATUS_EXECUTOR.submit(self._get_gpu_details)
+        ollama_future = _STATUS_EXECUTOR.submit(self._check_ollama_status)
+
         status = {
             'timestamp': datetime.now().isoformat(),
             'os_info': self._get_os_info(),
@@ -29,25 +119,31 @@ class KaiaCLI:
             'python_version': platform.python_version(),
             'cpu_info': self._get_cpu_info_detailed(),
             'memory_info': self._get_memory_info(),
-            'all_disk_usage': self._get_all_disk_usage(),
-            'gpu_info': self._get_gpu_details(),
+            'all_disk_usage': disk_future.result(),
+            'gpu_info': gpu_future.result(),
             'vulkan_info': self._get_vulkan_info(),
             'opencl_info': self._get_opencl_info(),
             'uptime': self._get_uptime(),
             'board_info': self._get_board_info(),
-            'ollama_status': self._check_ollama_status(),
+            'ollama_status': ollama_future.result(),
         }
-        return status
+        self._status_cache = (now, status)
+        return dict(status)
 
     # System Status Formatting
     def format_system_status_output(self, status_info: Dict[str, Any]) -> str:
+        blue, reset = config.COLOR_BLUE, config.COLOR_RESET
+
+        def line(label: str, value: Any) -> str:
+            return f"• {blue}{label}:{reset} {value}"
+
         msg_parts = [
-            f"• {config.COLOR_BLUE}Date & Time:{config.COLOR_RESET} {datetime.fromisoformat(status_info.get('timestamp', datetime.now().isoformat())).strftime('%Y-%m-%d %H:%M:%S')}",
-            f"• {config.COLOR_BLUE}Uptime:{config.COLOR_RESET} {status_info.get('uptime', 'N/A')}",
-            f"• {config.COLOR_BLUE}Board:{config.COLOR_RESET} {status_info.get('board_info', 'N/A')}",
-            f"• {config.COLOR_BLUE}OS:{config.COLOR_RESET} {status_info.get('os_info', 'N/A')}",
-            f"• {config.COLOR_BLUE}Kernel:{config.COLOR_RESET} {platform.release()}",
-            f"• {config.COLOR_BLUE}Python Version:{config.COLOR_RESET} {platform.python_version()}",
+            line("Date & Time", datetime.fromisoformat(status_info.get('timestamp', datetime.now().isoformat())).strftime('%Y-%m-%d %H:%M:%S')),
+            line("Uptime", status_info.get('uptime', 'N/A')),
+            line("Board", status_info.get('board_info', 'N/A')),
+            line("OS", status_info.get('os_info', 'N/A')),
+            line("Kernel", platform.release()),
+            line("Python Version", platform.python_version()),
         ]
 
         cpu_info = status_info.get('cpu_info', {})
@@ -55,34 +151,21 @@ class KaiaCLI:
             cpu_name = cpu_info.get('name', 'N/A')
             cpu_speed = cpu_info.get('speed', 'N/A')
             cpu_cores = cpu_info.get('logical_cores', 'N/A')
-            msg_parts.append(f"• {config.COLOR_BLUE}CPU:{config.COLOR_RESET} {cpu_name} ({cpu_cores}) @ {cpu_speed}")
+            msg_parts.append(line("CPU", f"{cpu_name} ({cpu_cores}) @ {cpu_speed}"))
 
         mem_info = status_info.get('memory_info', {})
         if mem_info:
-            total_gb = round(mem_info.get('total', 0) / (1024**3), 2)
-            available_gb = round(mem_info.get('available', 0) / (1024**3), 2)
+            total_gb = _gib(mem_info.get('total', 0))
+            available_gb = _gib(mem_info.get('available', 0))
             percent_used = mem_info.get('percent', 'N/A')
             percent_color = utils.get_color_for_percentage(percent_used)
-            msg_parts.append(f"• {config.COLOR_BLUE}Memory:{config.COLOR_RESET} {total_gb} GB total, {available_gb} GB available ({percent_color}{percent_used}% used{config.COLOR_RESET})")
+            msg_parts.append(line("Memory", f"{total_gb} GB total, {available_gb} GB available ({percent_color}{percent_used}% used{reset})"))
 
         all_disk_usage = status_info.get('all_disk_usage', [])
 
-        formatted_disks = {}
+        disks_by_path = {}
         for disk in all_disk_usage:
-            path = disk.get('mount_point', 'N/A')
-            label = disk.get('label', 'N/A')
-
-            if disk.get('status') == 'Error':
-                formatted_disks[path] = f"• {config.COLOR_RED}Disk Usage ('{label}'):{config.COLOR_RESET} Error - {disk.get('error_message', 'N/A')}"
-            else:
-                total_gb = round(disk.get('total', 0) / (1024**3), 2)
-                used_gb = round(disk.get('used', 0) / (1024**3), 2)
-                percent_used = disk.get('percent', 'N/A')
-                percent_color = utils.get_color_for_percentage(percent_used)
-                formatted_disks[path] = {
-                    'string': f"• {config.COLOR_BLUE}Disk Usage ('{label}'):{config.COLOR_RESET} {total_gb} GB total, {used_gb} GB used ({percent_color}{percent_used}% used{config.COLOR_RESET})",
-                    'data': disk
-                }
+            disks_by_path[disk.get('mount_point', 'N/A')] = disk
 
         desired_order = [
             {'path': '/', 'new_label': 'Root'},
@@ -90,53 +173,57 @@ class KaiaCLI:
             {'path': '/boot', 'new_label': 'Boot'},
         ]
 
+        seen = set()
         for item in desired_order:
             path = item['path']
-            new_label = item['new_label']
-            if path in formatted_disks:
-                disk_data = formatted_disks[path]['data']
-                if disk_data.get('status') == 'Error':
-                    msg_parts.append(f"• {config.COLOR_RED}Disk Usage ('{new_label}'):{config.COLOR_RESET} Error - {disk_data.get('error_message', 'N/A')}")
-                else:
-                    total_gb = round(disk_data.get('total', 0) / (1024**3), 2)
-                    used_gb = round(disk_data.get('used', 0) / (1024**3), 2)
-                    percent_used = disk_data.get('percent', 'N/A')
-                    percent_color = utils.get_color_for_percentage(percent_used)
-                    msg_parts.append(f"• {config.COLOR_BLUE}Disk Usage ('{new_label}'):{config.COLOR_RESET} {total_gb} GB total, {used_gb} GB used ({percent_color}{percent_used}% used{config.COLOR_RESET})")
-
-                del formatted_disks[path]
-
-        for path in formatted_disks:
-            msg_parts.append(formatted_disks[path]['string'])
+            if path in disks_by_path:
+                msg_parts.append(self._format_disk(disks_by_path[path], item['new_label']))
+                seen.add(path)
+
+        # Remaining mounts in config order, under their configured labels
+        for path, disk in disks_by_path.items():
+            if path in seen:
+                continue
+            msg_parts.append(self._format_disk(disk, disk.get('label', 'N/A')))
 
         if not all_disk_usage:
-            msg_parts.append(f"• {config.COLOR_BLUE}Disk Usage:{config.COLOR_RESET} N/A")
+            msg_parts.append(line("Disk Usage", "N/A"))
 
         gpu_info = status_info.get('gpu_info', [])
         if gpu_info:
             for i, gpu in enumerate(gpu_info):
                 gpu_name = gpu.get('name', 'N/A')
                 gpu_type = gpu.get('type', 'N/A')
-                msg_parts.append(f"• {config.COLOR_BLUE}GPU {i+1}:{config.COLOR_RESET} {gpu_name} [{gpu_type}]")
+                msg_parts.append(line(f"GPU {i+1}", f"{gpu_name} [{gpu_type}]"))
         else:
-            msg_parts.append(f"• {config.COLOR_BLUE}GPU:{config.COLOR_RESET} N/A")
+            msg_parts.append(line("GPU", "N/A"))
 
         vulkan_info = status_info.get('vulkan_info', 'N/A')
         opencl_info = status_info.get('opencl_info', 'N/A')
-        msg_parts.append(f"• {config.COLOR_BLUE}Vulkan:{config.COLOR_RESET} {vulkan_info}")
-        msg_parts.append(f"• {config.COLOR_BLUE}OpenCL:{config.COLOR_RESET} {opencl_info}")
+        msg_parts.append(line("Vulkan", vulkan_info))
+        msg_parts.append(line("OpenCL", opencl_info))
 
         ollama_status = status_info.get('ollama_status', 'N/A')
-        msg_parts.append(f"• {config.COLOR_BLUE}Ollama Server:{config.COLOR_RESET} {ollama_status}")
+        msg_parts.append(line("Ollama Server", ollama_status))
 
         db_status = status_info.get('db_status', {})
         if db_status.get('connected'):
-            msg_parts.append(f"• {config.COLOR_BLUE}Database:{config.COLOR_RESET} Connected (Tables: {', '.join(db_status.get('tables', []))})")
+            msg_parts.append(line("Database", f"Connected (Tables: {', '.join(db_status.get('tables', []))})"))
         else:
-            msg_parts.append(f"• {config.COLOR_BLUE}Database:{config.COLOR_RESET} Not Connected ({db_status.get('error', 'Unknown error')})")
+            msg_parts.append(line("Database", f"Not Connected ({db_status.get('error', 'Unknown error')})"))
 
         return "\n".join(msg_parts)
 
+    # Disk Line Formatting
+    def _format_disk(self, disk: Dict[str, Any], label: str) -> str:
+        if disk.get('status') == 'Error':
+            return f"• {config.COLOR_RED}Disk Usage ('{label}'):{config.COLOR_RESET} Error - {disk.get('error_message', 'N/A')}"
+        total_gb = _gib(disk.get('total', 0))
+        used_gb = _gib(disk.get('used', 0))
+        percent_used = disk.get('percent', 'N/A')
+        percent_color = utils.get_color_for_percentage(percent_used)
+        return f"• {config.COLOR_BLUE}Disk Usage ('{label}'):{config.COLOR_RESET} {total_gb} GB total, {used_gb} GB used ({percent_color}{percent_used}% used{config.COLOR_RESET})"
+
     # OS Information
     def _get_os_info(self) -> str:
         return f"Arch Linux {platform.machine()}"
@@ -147,8 +234,7 @@ class KaiaCLI:
 
     # Uptime Calculation
     def _get_uptime(self) -> str:
-        boot_time_timestamp = psutil.boot_time()
-        boot_datetime = datetime.fromtimestamp(boot_time_timestamp)
+        boot_datetime = datetime.fromtimestamp(self._boot_time)
         current_datetime = datetime.now()
         uptime_delta = current_datetime - boot_datetime
 
@@ -185,27 +271,30 @@ class KaiaCLI:
 
     # Detailed CPU Information
     def _get_cpu_info_detailed(self) -> Dict[str, Union[float, int, str]]:
-        cpu_name = "N/A"
+        cpu_name = self._cpu_name or "N/A"
         cpu_speed = "N/A"
         try:
+            # Both fields sit in the first processor block; no need to walk every core
             with open('/proc/cpuinfo', 'r') as f:
-                for line in f:
-                    if "model name" in line:
-                        cpu_name = line.split(':')[-1].strip()
-                    if "cpu MHz" in line:
-                        mhz = float(line.split(':')[-1].strip())
-                        cpu_speed = f"{mhz / 1000:.2f} GHz" if mhz >= 1000 else f"{mhz:.0f} MHz"
-                    if cpu_name != "N/A" and cpu_speed != "N/A":
-                        break
+                data = f.read(CPUINFO_READ_BYTES)
+            if self._cpu_name is None:
+                name_match = _CPU_MODEL_RE.search(data)
+                if name_match:
+                    # Model never changes; MHz does, so only the name is cached
+                    cpu_name = self._cpu_name = name_match.group(1).strip()
+            mhz_match = _CPU_MHZ_RE.search(data)
+            if mhz_match:
+                mhz = float(mhz_match.group(1))
+                cpu_speed = f"{mhz / 1000:.2f} GHz" if mhz >= 1000 else f"{mhz:.0f} MHz"
         except Exception as e:
             logger.warning(f"Could not read CPU info from /proc/cpuinfo: {e}")
 
         return {
             'name': cpu_name,
             'speed': cpu_speed,
-            'percent': psutil.cpu_percent(interval=1),
-            'cores': psutil.cpu_count(logical=False),
-            'logical_cores': psutil.cpu_count(logical=True)
+            'percent': psutil.cpu_percent(interval=None),
+            'cores': self._physical_cores,
+            'logical_cores': self._logical_cores
         }
 
     # Disk Usage Information
@@ -249,6 +338,10 @@ class KaiaCLI:
             'memory_free_mb': 'N/A'
         })
 
+        if self._nvml_handles is not None:
+            gpu_data.extend(self._get_nvml_gpu_details())
+            return gpu_data
+
         try:
             cmd = ["nvidia-smi", "--query-gpu=name,utilization.gpu,memory.total,memory.used,memory.free", "--format=csv,noheader,nounits"]
             result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=config.TIMEOUT_SECONDS)
@@ -273,6 +366,28 @@ class KaiaCLI:
 
         return gpu_data
 
+    def _get_nvml_gpu_details(self) -> List[Dict[str, Any]]:
+        nvml_data = []
+        for handle in self._nvml_handles:
+            try:
+                name = pynvml.nvmlDeviceGetName(handle)
+                if isinstance(name, bytes):  # Older pynvml releases return bytes
+                    name = name.decode()
+                utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                # NVML reports bytes; nvidia-smi's nounits output was MiB
+                nvml_data.append({
+                    'name': name,
+                    'type': 'Discrete',
+                    'utilization_gpu_percent': float(utilization.gpu),
+                    'memory_total_mb': memory.total / 1024**2,
+                    'memory_used_mb': memory.used / 1024**2,
+                    'memory_free_mb': memory.free / 1024**2
+                })
+            except pynvml.NVMLError as e:
+                logger.error(f"Error retrieving NVIDIA GPU info: {e}")
+        return nvml_data
+
     # Vulkan Information
     def _get_vulkan_info(self) -> str:
         return "1.4.311 - NVIDIA [575.64.03] radv [Mesa 25.1.6-arch1.1]"
@@ -283,10 +398,11 @@ class KaiaCLI:
 
     # Ollama Server Status Check
     def _check_ollama_status(self) -> str:
+        # In-process TCP connect, same check as `nc -z` without the fork/exec
         try:
-            subprocess.run(["nc", "-z", "localhost", "11434"], check=True, capture_output=True, timeout=5)
-            return "Running"
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            with socket.create_connection(("localhost", 11434), timeout=1):
+                return "Running"
+        except OSError:
             return "Not Running"
         except Exception as e:
             logger.error(f"Error checking Ollama status: {e}")
@@ -320,40 +436,20 @@ class KaiaCLI:
 
             logger.debug(f"Raw command from LLM: '{raw_command}'")
 
-            code_block_match = re.search(r'```(?:bash|sh)?\n(.*?)```', raw_command, re.DOTALL)
+            code_block_match = _CODE_BLOCK_RE.search(raw_command)
             if code_block_match:
                 clean_command = code_block_match.group(1).strip()
             else:
                 clean_command = raw_command
 
-            clean_command = re.sub(r'(User:|Assistant:)\s*', '', clean_command, flags=re.IGNORECASE).strip()
-            clean_command = re.sub(r'\s*\n\s*', ' ', clean_command).strip()
+            clean_command = _ROLE_PREFIX_RE.sub('', clean_command).strip()
+            clean_command = _LINE_BREAK_RE.sub(' ', clean_command).strip()
 
-            command_pattern_match = re.match(r'^\s*([a-zA-Z0-9_./-]+(?:\s+[^&;|`\n]*)*)', clean_command)
+            command_pattern_match = _COMMAND_RE.match(clean_command)
             if command_pattern_match:
                 clean_command = command_pattern_match.group(1).strip()
             else:
-                conversational_phrases = [
-                    r'That covers.*',
-                    r'Here is the command.*',
-                    r'The command is.*',
-                    r'Here\'s the command.*',
-                    r'This is the command.*',
-                    r'I can only provide raw shell commands.*',
-                    r'Feel free to ask.*',
-                    r'Just remember that I can only provide raw commands.*',
-                    r'Keep in mind that I can only provide raw shell commands.*',
-                    r'If you need help with more specific tasks.*',
-                    r'Please find the command below.*',
-                    r'The requested command is.*',
-                    r'Here you go.*',
-                    r'Here\'s what you asked for.*',
-                    r'As per your request.*',
-                    r'This should do the trick.*',
-                    r'```[\s\S]*?```'
-                ]
-                for phrase in conversational_phrases:
-                    clean_command = re.sub(phrase, '', clean_command, flags=re.IGNORECASE | re.DOTALL).strip()
+                clean_command = _strip_conversational(clean_command)
 
             clean_command = clean_command.strip('"').strip("'").strip()
 
@@ -361,7 +457,7 @@ class KaiaCLI:
                 lines = raw_command.strip().split('\n')
                 for line in reversed(lines):
                     stripped_line = line.strip()
-                    if stripped_line and not re.match(r'(User:|Assistant:)', stripped_line, re.IGNORECASE):
+                    if stripped_line and not _ROLE_PREFIX_RE.match(stripped_line):
                         clean_command = stripped_line
                         break
                 clean_command = clean_command.strip('"').strip("'").strip()
@@ -369,11 +465,11 @@ class KaiaCLI:
 
             logger.debug(f"Cleaned command for validation: '{clean_command}'")
 
-            if any(clean_command.startswith(cmd) for cmd in config.SAFE_COMMAND_ALLOWLIST):
+            command_name = clean_command.split(maxsplit=1)[0] if clean_command else ""
+            if command_name in config.SAFE_COMMAND_ALLOWLIST:
                 return clean_command, None
 
-            unsafe_operators = ['&&', ';', '||', '`', '\n']
-            if any(op in clean_command for op in unsafe_operators):
+            if not _UNSAFE_CHARS.isdisjoint(clean_command):
                 logger.warning(f"Unsafe command filtered: {clean_command}")
                 return "", "ERROR: Generated command contained unsafe operators."
 
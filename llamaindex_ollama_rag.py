@@ -456,11 +456,11 @@ To run a command, type 'run command <your command>' or '!<your command>'.
     while True:
         try:
             user_id = database_utils.get_current_user()
-            database_utils.ensure_user(user_id)
 
             query = input("\nYou: ").strip()
+            query_lower = query.lower()
 
-            if query.lower() in ['exit', 'quit', '/exit', '/quit']:
+            if query_lower in ['exit', 'quit', '/exit', '/quit']:
                 print(f"{config.COLOR_BLUE}Kaia: Session ended. Until next time!{config.COLOR_RESET}")
                 break
             if not query:
@@ -472,11 +472,12 @@ To run a command, type 'run command <your command>' or '!<your command>'.
 
             if query.startswith('/') or query.startswith('!'):
                 cmd_query = query[1:].strip()
-                if cmd_query.lower() == 'help':
+                cmd_query_lower = query_lower[1:].strip()
+                if cmd_query_lower == 'help':
                     response = "Help: Use /status, /exit, or natural language."
                     response_type = "help"
                     print(f"{config.COLOR_BLUE}Kaia: {response}{config.COLOR_RESET}")
-                elif cmd_query.lower() == 'status':
+                elif cmd_query_lower == 'status':
                     status_info = cli.get_system_status()
                     status_info['db_status'] = database_utils.get_database_status()
                     response = cli.format_system_status_output(status_info)
@@ -505,8 +506,12 @@ To run a command, type 'run command <your command>' or '!<your command>'.
             content = plan.get("content", query)
 
             if action == "store_data":
-                if isinstance(content, list): content = ' '.join(content)
-                storage_handled, storage_response = database_utils.handle_memory_storage(user_id, content)
+                if isinstance(content, list) and len(content) > 1:
+                    # Several memories in one plan: store each, in one transaction
+                    storage_handled, storage_response = database_utils.handle_memory_storage_bulk(user_id, [str(item) for item in content])
+                else:
+                    if isinstance(content, list): content = ' '.join(content)
+                    storage_handled, storage_response = database_utils.handle_memory_storage(user_id, content)
                 response = storage_response
                 response_type = "store_data"
                 print(f"\n{config.COLOR_BLUE}Kaia: {response}{config.COLOR_RESET}")
@@ -691,5 +696,8 @@ To run a command, type 'run command <your command>' or '!<your command>'.
             except Exception as log_e:
                 logger.error(f"Failed to log error: {log_e}")
 
+    # Write out interactions still queued for the background writer
+    database_utils.flush_interactions()
+
 if __name__ == "__main__":
     main()